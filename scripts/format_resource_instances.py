@@ -1,61 +1,265 @@
 #!/usr/bin/env python3
 import argparse
+import functools
 import gzip
+import hashlib
 import json
 import os
+import re
 import sys
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Iterable, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from resource_instance_io import GZIP_BACKEND, gzip_decompress, orjson, parse_json_bytes, prefetch, scan_instance_dir
 
-def load_json_bytes(path: Path) -> Tuple[object, bool]:
-    raw = path.read_bytes()
+BACKEND_HELP = (
+    "Gzipped .rpg files are decompressed with isal when installed, "
+    f"falling back to the stdlib gzip module (current backend: {GZIP_BACKEND}). "
+    "JSON is parsed and serialized with orjson when installed."
+)
+
+# Floats orjson spells differently from json.dumps (1e20 vs 1e+20, 0.00001 vs 1e-05). In
+# indented output only number tokens end a line with a digit, so this can't hit strings.
+ORJSON_EXPONENT_PATTERN = re.compile(rb"e-?[0-9]+,?\n")
+NON_ASCII_PATTERN = re.compile("[^\x00-\x7e]+")
+
+# (decompressed JSON, whether the file was gzipped, bytes as stored on disk)
+RawJson = Tuple[bytes, bool, bytes]
+
+# Sidecar of files known to be formatted, keyed by repo-relative path -> [mtime_ns, size].
+FORMAT_CACHE_PATH = Path(__file__).with_name(".format_cache.json")
+# Digests of formatted files' canonical bytes, written only with --write-hashes. Unlike the
+# cache above it does not depend on mtimes, so it can be committed and lets --check on a fresh
+# checkout skip parsing. It is only a speed-up for local runs: a change can add a digest for its
+# own unformatted file, so CI must pass --no-cache to --check.
+FORMATTED_HASHES_PATH = Path(__file__).with_name(".formatted.hashes")
+# Version of the canonical output (json.dumps(indent=2, ensure_ascii=True) plus a trailing
+# newline, gzipped with mtime=0). Bump it whenever that output changes so that recorded
+# hashes stop being trusted; edits that keep the output intact don't void a committed file.
+FORMAT_VERSION = "1"
+
+
+class JsonConstant(float):
+    """NaN/Infinity parsed by json; orjson refuses float subclasses, so these dump via json."""
+
+
+def escape_non_ascii(match: "re.Match[str]") -> str:
+    return json.encoder.encode_basestring_ascii(match.group())[1:-1]
+
+
+def is_plain_ascii(payload: bytes) -> bool:
+    # With no non-ASCII bytes, \u escapes or DEL (which only ensure_ascii escapes) in the input,
+    # json.dumps writes the same text with or without ensure_ascii, and the fast mode skips the
+    # per-character escaping scan.
+    return payload.isascii() and b"\\u" not in payload and b"\x7f" not in payload
+
+
+def format_json(obj: object, source: bytes) -> bytes:
+    """Serialize ``obj`` exactly as json.dumps would; ``source`` is the JSON it was parsed from."""
+    plain_ascii = is_plain_ascii(source)
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            data = None
+        if (
+            data is not None
+            and b"0.0000" not in data
+            and not ORJSON_EXPONENT_PATTERN.search(data)
+            # Literals like 1e400 parse as infinity, which orjson writes as null and json as
+            # Infinity; any null the source didn't have sends the file to json.
+            and data.count(b"null") <= source.count(b"null")
+        ):
+            if plain_ascii or (data.isascii() and b"\x7f" not in data):
+                return data
+            # Non-ASCII only ever appears inside strings, so escaping it like ensure_ascii does
+            # yields exactly what json.dumps would have produced.
+            return NON_ASCII_PATTERN.sub(escape_non_ascii, data.decode("utf-8")).encode("ascii")
+    return (json.dumps(obj, indent=2, ensure_ascii=not plain_ascii) + "\n").encode("utf-8")
+
+
+def read_json_bytes(path: str) -> RawJson:
+    with open(path, "rb") as fh:
+        raw = fh.read()
     is_gz = raw[:2] == b"\x1f\x8b"
-    if is_gz:
-        raw = gzip.decompress(raw)
-    try:
-        text = raw.decode("utf-8")
-    except UnicodeDecodeError:
-        text = raw.decode("utf-8-sig")
-    return json.loads(text), is_gz
+    payload = gzip_decompress(raw) if is_gz else raw
+    return payload, is_gz, raw
 
 
-def dump_json_bytes(obj: object, gzip_output: bool) -> bytes:
-    formatted = json.dumps(obj, indent=2, ensure_ascii=True) + "\n"
-    data = formatted.encode("utf-8")
+def dump_json_bytes(obj: object, gzip_output: bool, source: bytes) -> bytes:
+    data = format_json(obj, source)
     if gzip_output:
         data = gzip.compress(data, mtime=0)
     return data
 
 
-def iter_instance_files(systems_root: Path, system_filter: Optional[str]) -> Iterable[Path]:
-    for system_dir in systems_root.iterdir():
-        if not system_dir.is_dir():
-            continue
-        if system_filter and system_dir.name != system_filter:
-            continue
-        instances_dir = system_dir / "resource_instances"
-        if not instances_dir.is_dir():
+def iter_instance_files(systems_root: Path, system_filter: Optional[str]) -> Iterable[str]:
+    # Paths stay plain strings: building a Path per file cost more than the walk itself.
+    with os.scandir(systems_root) as entries:
+        system_dirs = [
+            entry.path
+            for entry in entries
+            if entry.is_dir() and (not system_filter or entry.name == system_filter)
+        ]
+    for system_dir in system_dirs:
+        instances_dir = os.path.join(system_dir, "resource_instances")
+        # Opening the directory doubles as the existence check the walk needs anyway. Missing and
+        # unreadable folders are both skipped, as the is_dir() check and os.walk did.
+        try:
+            root_entries = os.scandir(instances_dir)
+        except OSError:
             continue
-        for root, _dirs, files in os.walk(instances_dir):
-            for filename in files:
-                if filename.startswith("."):
-                    continue
-                if not (filename.endswith(".json") or filename.endswith(".rpg")):
-                    continue
-                yield Path(root) / filename
+        yield from scan_instance_dir(instances_dir, root_entries)
+
+
+def content_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def format_file(
+    path: str,
+    expected_digest: Optional[str] = None,
+    pending_read: "Optional[Future[RawJson]]" = None,
+    write: bool = True,
+) -> Tuple[str, bool, Optional[str], Optional[str]]:
+    try:
+        payload, is_gz, raw = read_json_bytes(path) if pending_read is None else pending_read.result()
+        digest = content_digest(raw)
+        # Touched but unchanged since it was last written in canonical form.
+        if digest == expected_digest:
+            return path, False, None, digest
+        obj = parse_json_bytes(payload, JsonConstant)
+    except Exception as exc:  # noqa: BLE001 - report parse issues
+        return path, False, f"{path}: Failed to parse JSON: {exc}", None
+    output = dump_json_bytes(obj, is_gz, payload)
+    if raw != output:
+        if write:
+            with open(path, "wb") as fh:
+                fh.write(output)
+        return path, True, None, content_digest(output)
+    return path, False, None, digest
+
+
+def formatter_id() -> str:
+    return content_digest(Path(__file__).read_bytes())
+
+
+# Cache entries are [mtime_ns, size, digest of the canonical bytes on disk].
+CacheEntry = List[object]
+
+
+def load_format_cache(cache_path: Path, current_formatter: str) -> Dict[str, CacheEntry]:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("formatter") != current_formatter:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def save_format_cache(cache_path: Path, current_formatter: str, files: Dict[str, CacheEntry]) -> None:
+    data = {"formatter": current_formatter, "files": files}
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(data, sort_keys=True, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # An unwritable cache only means a cache miss next run.
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def load_formatted_hashes(hashes_path: Path) -> Dict[str, str]:
+    try:
+        lines = hashes_path.read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return {}
+    if not lines or lines[0] != f"format-version {FORMAT_VERSION}":
+        return {}
+    hashes = {}
+    for line in lines[1:]:
+        digest, _, key = line.partition(" ")
+        if key:
+            hashes[key] = digest
+    return hashes
+
+
+def save_formatted_hashes(hashes_path: Path, hashes: Dict[str, str]) -> None:
+    lines = [f"format-version {FORMAT_VERSION}"]
+    lines += [f"{hashes[key]} {key}" for key in sorted(hashes)]
+    try:
+        hashes_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    except OSError as exc:
+        # Like the cache, missing hashes only cost speed, so this doesn't fail the run.
+        print(f"Warning: could not write {hashes_path}: {exc}", file=sys.stderr)
+
+
+def file_signature(path: str) -> Optional[List[object]]:
+    # None for a path that can't be stat'ed (a dangling symlink, a file removed mid-run); such
+    # files are never cached and format_file reports them when it fails to read them.
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
 
 
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Pretty-format all resource instance JSON files under systems/*/resource_instances.",
+        epilog=BACKEND_HELP,
     )
     parser.add_argument(
         "--system",
         default=None,
         help="Limit formatting to a single system folder under systems/ (optional)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count, or 1 with --prefetch; 1 disables "
+        "the process pool)",
+    )
+    parser.add_argument(
+        "--prefetch",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Format in-process, reading up to N files ahead on background threads "
+        "(useful on slow or network storage; default: 0, off)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Re-check every file instead of skipping ones recorded in {FORMAT_CACHE_PATH.name} "
+        f"or {FORMATTED_HASHES_PATH.name}",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Don't write files; list the ones that would be reformatted and exit 1 if there are any. "
+        f"Files whose digest is in {FORMATTED_HASHES_PATH.name} are trusted without parsing, and "
+        "that file can be edited by the change under test, so CI should run --check --no-cache",
+    )
+    parser.add_argument(
+        "--write-hashes",
+        action="store_true",
+        help=f"Also record the formatted files in {FORMATTED_HASHES_PATH.name}; commit it so "
+        "--check on a fresh checkout can skip parsing unchanged files",
+    )
     args = parser.parse_args()
+    if args.jobs is None:
+        args.jobs = 1 if args.prefetch > 0 else os.cpu_count() or 1
+    elif args.prefetch > 0 and args.jobs > 1:
+        parser.error("--prefetch reads ahead in-process, so it needs --jobs 1")
+    if args.check and args.write_hashes:
+        parser.error("--write-hashes can't be combined with --check")
 
     repo_root = Path(__file__).resolve().parents[1]
     systems_root = repo_root / "systems"
@@ -69,27 +273,86 @@ def main() -> int:
         print(f"No resource instance files found for {target}.", file=sys.stderr)
         return 1
 
-    errors = []
-    changed = 0
+    current_formatter = formatter_id()
+    cached = {} if args.no_cache else load_format_cache(FORMAT_CACHE_PATH, current_formatter)
+    recorded_hashes = load_formatted_hashes(FORMATTED_HASHES_PATH)
+    known_hashes = {} if args.no_cache else recorded_hashes
+    # A --system run only refreshes its own entries; a full run rebuilds the cache. Dropping the
+    # system's old entries up front keeps files deleted since the last run out of both sidecars.
+    system_prefix = f"systems/{args.system}/" if args.system else ""
+    cache = {key: entry for key, entry in cached.items() if not key.startswith(system_prefix)}
+    # Cache keys are repo-relative posix paths; every walked path starts with repo_root.
+    root_prefix_len = len(os.path.join(repo_root, ""))
+    pending = []
+    expected_digests: List[Optional[str]] = []
     for path in files:
-        try:
-            obj, is_gz = load_json_bytes(path)
-        except Exception as exc:  # noqa: BLE001 - report parse issues
-            errors.append(f"{path}: Failed to parse JSON: {exc}")
+        key = path[root_prefix_len:].replace(os.sep, "/")
+        signature = file_signature(path)
+        entry = cached.get(key)
+        if signature is not None and entry is not None and entry[:2] == signature:
+            cache[key] = entry
+        else:
+            cache.pop(key, None)
+            pending.append(path)
+            # A touched file whose bytes still hash to the cached digest can skip re-formatting.
+            if entry is not None and len(entry) == 3:
+                expected_digests.append(entry[2])
+            else:
+                expected_digests.append(known_hashes.get(key))
+
+    errors = []
+    changed = []
+    process = functools.partial(format_file, write=not args.check)
+    jobs = min(args.jobs, len(pending))
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            chunksize = max(1, len(pending) // (jobs * 8))
+            results = list(executor.map(process, pending, expected_digests, chunksize=chunksize))
+    elif args.prefetch > 0:
+        reads = prefetch(read_json_bytes, pending, args.prefetch)
+        results = [process(path, digest, read) for (path, read), digest in zip(reads, expected_digests)]
+    else:
+        results = [process(path, digest) for path, digest in zip(pending, expected_digests)]
+    for path, file_changed, error, digest in results:
+        if error is not None:
+            errors.append(error)
             continue
-        output = dump_json_bytes(obj, is_gz)
-        if path.read_bytes() != output:
-            path.write_bytes(output)
-            changed += 1
+        if file_changed:
+            changed.append(path)
+            if args.check:
+                continue  # still unformatted on disk, so nothing to record
+        signature = file_signature(path)
+        if signature is not None:
+            cache[path[root_prefix_len:].replace(os.sep, "/")] = signature + [digest]
+    if not args.check:
+        save_format_cache(FORMAT_CACHE_PATH, current_formatter, cache)
+    if args.write_hashes:
+        # Like the cache, a --system run only replaces that system's entries.
+        hashes = {key: digest for key, digest in recorded_hashes.items() if not key.startswith(system_prefix)}
+        hashes.update((key, entry[2]) for key, entry in cache.items() if key.startswith(system_prefix))
+        if hashes != recorded_hashes:
+            save_formatted_hashes(FORMATTED_HASHES_PATH, hashes)
 
     if errors:
         print("Formatting errors:", file=sys.stderr)
         for err in errors:
             print(f"- {err}", file=sys.stderr)
         print(f"{len(errors)} error(s).", file=sys.stderr)
+
+    if args.check:
+        if changed:
+            print("Files that would be reformatted:", file=sys.stderr)
+            for path in changed:
+                print(f"- {path}", file=sys.stderr)
+            print(f"{len(changed)} file(s) would be reformatted out of {len(files)}.", file=sys.stderr)
+        if errors or changed:
+            return 1
+        print(f"All {len(files)} file(s) are formatted.")
+        return 0
+    if errors:
         return 1
 
-    print(f"Formatted {changed} file(s) out of {len(files)}.")
+    print(f"Formatted {len(changed)} file(s) out of {len(files)}.")
     return 0
 
 
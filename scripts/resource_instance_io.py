@@ -0,0 +1,114 @@
+"""File discovery, reading and parsing helpers shared by the resource instance scripts."""
+import collections
+import gzip
+import itertools
+import json
+import os
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Iterator, Optional, Sequence, Tuple, TypeVar
+
+
+# Optional faster gzip decompression (pip install isal). Only decompression is offered:
+# the formatter compresses with the stdlib so re-gzipped output is identical whichever
+# backend is installed. libdeflate's gzip_decompress isn't used: it sizes its output from
+# the last trailer, so zero-padded and multi-member files come back short or fail.
+try:
+    from isal import igzip as _igzip
+except ImportError:
+    _igzip = None
+
+if _igzip is not None:
+    GZIP_BACKEND = "isal"
+    gzip_decompress = _igzip.decompress
+else:
+    GZIP_BACKEND = "gzip"
+
+    def gzip_decompress(data: bytes) -> bytes:
+        # Single-member streams (all gzip.compress writes) inflate in one C call, skipping
+        # gzip.decompress's Python-level header and CRC handling. Anything else, including
+        # corrupt input, goes through gzip.decompress for its exact behavior and errors.
+        decompressor = zlib.decompressobj(wbits=31)
+        try:
+            result = decompressor.decompress(data)
+        except zlib.error:
+            return gzip.decompress(data)
+        if decompressor.eof and not decompressor.unused_data:
+            return result
+        return gzip.decompress(data)
+
+
+# Optional faster JSON parsing (pip install orjson).
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson turns integers wider than 64 bits into floats, so files with long digit runs go to json.
+DIGIT_RUN_TABLE = bytes(0x30 if 0x30 <= i <= 0x39 else 0x20 for i in range(256))
+LONG_DIGIT_RUN = b"0" * 19
+
+T = TypeVar("T")
+
+
+def parse_json_bytes(raw: bytes, parse_constant: Optional[Callable[[str], Any]] = None) -> Any:
+    if orjson is not None and LONG_DIGIT_RUN not in raw.translate(DIGIT_RUN_TABLE):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # json accepts a few inputs orjson rejects (NaN, lone surrogates)
+    try:
+        text = raw.decode("utf-8")
+    except UnicodeDecodeError:
+        text = raw.decode("utf-8-sig")
+    return json.loads(text, parse_constant=parse_constant)
+
+
+def scan_instance_dir(root: str, root_entries: "Optional[Iterator[os.DirEntry]]" = None) -> Iterator[str]:
+    # Same order as os.walk (a directory's files, then its subdirectories), but DirEntry
+    # types come from the directory listing, so no per-entry stat is needed. root_entries
+    # is an already open os.scandir(root) to walk instead of opening root again.
+    stack = [root]
+    while stack:
+        subdirs = []
+        path = stack.pop()
+        if root_entries is None:
+            try:
+                root_entries = os.scandir(path)
+            except OSError:
+                continue  # like os.walk, unreadable directories are skipped
+        with root_entries as entries:
+            for entry in entries:
+                # Like os.walk, every directory is entered; only dot-files are skipped.
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif not entry.name.startswith(".") and entry.name.endswith((".json", ".rpg")):
+                    yield entry.path
+        root_entries = None
+        stack.extend(reversed(subdirs))
+
+
+PREFETCH_WORKERS = 8
+
+
+def prefetch(
+    read: Callable[[str], T],
+    paths: Sequence[str],
+    window: int,
+) -> Iterator[Tuple[str, "Future[T]"]]:
+    """Yield ``(path, future of read(path))`` in order, keeping ``window`` reads in flight.
+
+    File reads and gzip inflation release the GIL, so they overlap with the caller's
+    parsing and checking of earlier files.
+    """
+    with ThreadPoolExecutor(max_workers=PREFETCH_WORKERS) as pool:
+        queued: Deque[Tuple[str, "Future[T]"]] = collections.deque()
+        remaining = iter(paths)
+        for path in itertools.islice(remaining, window):
+            queued.append((path, pool.submit(read, path)))
+        while queued:
+            item = queued.popleft()
+            for path in itertools.islice(remaining, 1):
+                queued.append((path, pool.submit(read, path)))
+            yield item
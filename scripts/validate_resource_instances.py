@@ -1,17 +1,50 @@
 #!/usr/bin/env python3
 import argparse
-import gzip
-import json
+import functools
+import hashlib
+import importlib.util
+import marshal
 import os
+import pickle
 import re
 import sys
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import CodeType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
+from resource_instance_io import GZIP_BACKEND, gzip_decompress, parse_json_bytes, prefetch, scan_instance_dir
 
-BASE_STAT_PATTERN = re.compile(r"^base\s+([^\s]+)\s+([A-Za-z0-9_]+)\s*\(")
-META_STATS = {"id", "updated_at"}
+BACKEND_HELP = (
+    "Gzipped .rpg files are decompressed with isal when installed, "
+    f"falling back to the stdlib gzip module (current backend: {GZIP_BACKEND}). "
+    "JSON is parsed with orjson when installed."
+)
+
+# Matches the same "base <type> <name>(" lines as stripping each line and matching from its
+# start would, but in one pass over the file; [^\S\n] keeps a match from spanning lines.
+BASE_STAT_PATTERN = re.compile(
+    r"^[^\S\n]*base [^\S\n]*(\S+)[^\S\n]+([A-Za-z0-9_]+)[^\S\n]*\(",
+    re.MULTILINE,
+)
+BASE_STAT_PATTERN_BYTES = re.compile(BASE_STAT_PATTERN.pattern.encode("ascii"), re.MULTILINE)
+META_STATS = frozenset({"id", "updated_at"})
+# A top-level resource_id that is the object's first key and has no escapes. The formatter keeps
+# key order, so files that start with another key (many 5e2024 ones lead with "system") always
+# take the full parse.
+RESOURCE_ID_PEEK_PATTERN = re.compile(rb'\A\{\s*"resource_id"\s*:\s*"([^"\\]+)"')
+
+
+# (file, path segments, message); formatted for display only once validation is done. Instance
+# paths stay plain strings from the directory walk on; Path objects are only built for display.
+ErrorRecord = Tuple[str, Tuple[str, ...], str]
+
+# Per-process state for validate_file, set once by init_worker instead of pickled per task.
+WORKER_SCHEMA: Dict[str, Dict[str, "StatType"]] = {}
+
+# resource_id -> (stats schema it was compiled from, compiled validator); see get_validator.
+VALIDATORS: Dict[str, Tuple[Dict[str, "StatType"], Callable[..., None]]] = {}
 
 
 @dataclass(frozen=True)
@@ -24,6 +57,7 @@ class StatType:
         return StatType(self.kind, False, self.resource_type)
 
 
+@functools.lru_cache(maxsize=None)
 def parse_type(type_token: str) -> StatType:
     is_array = type_token.endswith("[]")
     core = type_token[:-2] if is_array else type_token
@@ -38,48 +72,124 @@ def parse_type(type_token: str) -> StatType:
 
 def load_schema(resources_root: Path) -> Dict[str, Dict[str, StatType]]:
     schema: Dict[str, Dict[str, StatType]] = {}
-    for root, _dirs, files in os.walk(resources_root):
-        if "stats.rpgs" not in files:
-            continue
-        resource_id = Path(root).name
-        stats_path = Path(root) / "stats.rpgs"
-        schema[resource_id] = parse_stats_file(stats_path)
+    for entry in iter_stats_files(resources_root):
+        stats_path = Path(entry.path)
+        schema[stats_path.parent.name] = parse_stats_file(stats_path)
     return schema
 
 
+def iter_stats_files(resources_root: Path) -> Iterator[os.DirEntry]:
+    # Visits directories in os.walk order, so a resource_id defined twice resolves the same way.
+    stack = [os.fspath(resources_root)]
+    while stack:
+        subdirs = []
+        try:
+            listing = os.scandir(stack.pop())
+        except OSError:
+            continue  # like os.walk, unreadable directories are skipped
+        with listing as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif entry.name == "stats.rpgs":
+                    yield entry
+        stack.extend(reversed(subdirs))
+
+
+def schema_fingerprint(resources_root: Path) -> str:
+    # Covers the stats files, this script (parsing and codegen rules) and the bytecode format
+    # of the cached validators.
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(importlib.util.MAGIC_NUMBER)
+    digest.update(Path(__file__).read_bytes())
+    stats_files = sorted((entry.path, entry.stat()) for entry in iter_stats_files(resources_root))
+    for path, st in stats_files:
+        digest.update(f"{path}:{st.st_mtime_ns}:{st.st_size}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_cached_schema(
+    resources_root: Path,
+    cache_path: Optional[Path],
+) -> Tuple[Dict[str, Dict[str, StatType]], Dict[str, bytes]]:
+    """Return the schema plus marshalled validator code, reusing ``cache_path`` when fresh.
+
+    The pickle holds plain tuples rather than StatType instances so it does not depend on
+    the module name the script was run under.
+    """
+    if cache_path is None:
+        return load_schema(resources_root), {}
+    fingerprint = schema_fingerprint(resources_root)
+    try:
+        with cache_path.open("rb") as fh:
+            cached_fingerprint, plain_schema, validator_code = pickle.load(fh)
+        if cached_fingerprint == fingerprint:
+            schema = {
+                rid: {name: StatType(*fields) for name, fields in stats.items()}
+                for rid, stats in plain_schema.items()
+            }
+            return schema, validator_code
+    except Exception:  # noqa: BLE001 - a missing or unreadable cache is just a miss
+        pass
+
+    schema = load_schema(resources_root)
+    validator_code = {
+        rid: marshal.dumps(validator_code_object(rid, stats_schema))
+        for rid, stats_schema in schema.items()
+    }
+    plain_schema = {
+        rid: {name: (t.kind, t.is_array, t.resource_type) for name, t in stats.items()}
+        for rid, stats in schema.items()
+    }
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("wb") as fh:
+            pickle.dump((fingerprint, plain_schema, validator_code), fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+    return schema, validator_code
+
+
 def parse_stats_file(path: Path) -> Dict[str, StatType]:
-    stats: Dict[str, StatType] = {}
-    for line in path.read_text(encoding="utf-8").splitlines():
-        stripped = line.strip()
-        if not stripped.startswith("base "):
-            continue
-        match = BASE_STAT_PATTERN.match(stripped)
-        if not match:
-            continue
-        type_token, stat_name = match.groups()
-        stats[stat_name] = parse_type(type_token)
-    return stats
-
-
-def read_json(path: Path) -> Any:
     raw = path.read_bytes()
+    # Bytes \s only covers ASCII whitespace and read_text would translate \r, so only plain
+    # ASCII files with \n line ends skip decoding.
+    if raw.isascii() and b"\r" not in raw:
+        return {
+            stat_name.decode("ascii"): parse_type(type_token.decode("ascii"))
+            for type_token, stat_name in BASE_STAT_PATTERN_BYTES.findall(raw)
+        }
+    text = path.read_text(encoding="utf-8")
+    return {stat_name: parse_type(type_token) for type_token, stat_name in BASE_STAT_PATTERN.findall(text)}
+
+
+def read_json_payload(path: str) -> bytes:
+    with open(path, "rb") as fh:
+        raw = fh.read()
     if raw[:2] == b"\x1f\x8b":
-        raw = gzip.decompress(raw)
-    try:
-        return json.loads(raw.decode("utf-8"))
-    except UnicodeDecodeError:
-        return json.loads(raw.decode("utf-8-sig"))
+        raw = gzip_decompress(raw)
+    return raw
 
 
-def format_path(path_stack: List[str]) -> str:
+def format_path(path_stack: Sequence[str]) -> str:
     return " -> ".join(path_stack) if path_stack else "<root>"
 
 
-def display_path(path: Path, repo_root: Path) -> str:
-    try:
-        return str(path.resolve().relative_to(repo_root.resolve()))
-    except ValueError:
-        return str(path)
+@functools.lru_cache(maxsize=None)
+def display_path(path: str, repo_root: Path) -> str:
+    # os.path.realpath is what Path.resolve uses, minus the Path objects.
+    resolved = os.path.realpath(path)
+    root = os.path.realpath(repo_root)
+    if resolved == root:
+        return "."
+    prefix = os.path.join(root, "")
+    return resolved[len(prefix) :] if resolved.startswith(prefix) else path
 
 
 def resource_label(resource_obj: Dict[str, Any]) -> str:
@@ -94,29 +204,30 @@ def resource_label(resource_obj: Dict[str, Any]) -> str:
 
 
 def add_error(
-    errors: List[str],
-    file_path: Path,
-    repo_root: Path,
+    errors: List[ErrorRecord],
+    file_path: str,
     path_stack: List[str],
     message: str,
 ) -> None:
-    location = format_path(path_stack)
-    errors.append(f"{display_path(file_path, repo_root)}: {location}: {message}")
+    errors.append((file_path, tuple(path_stack), message))
+
+
+def format_error(error: ErrorRecord, repo_root: Path) -> str:
+    file_path, path_stack, message = error
+    return f"{display_path(file_path, repo_root)}: {format_path(path_stack)}: {message}"
 
 
 def validate_resource_instance(
     resource_obj: Any,
     schema: Dict[str, Dict[str, StatType]],
-    errors: List[str],
-    file_path: Path,
-    repo_root: Path,
+    errors: List[ErrorRecord],
+    file_path: str,
     path_stack: List[str],
 ) -> None:
     if not isinstance(resource_obj, dict):
         add_error(
             errors,
             file_path,
-            repo_root,
             path_stack,
             f"Expected object for resource, got {type(resource_obj).__name__}",
         )
@@ -127,7 +238,6 @@ def validate_resource_instance(
         add_error(
             errors,
             file_path,
-            repo_root,
             path_stack,
             "Missing or invalid resource_id",
         )
@@ -138,7 +248,6 @@ def validate_resource_instance(
         add_error(
             errors,
             file_path,
-            repo_root,
             path_stack + [f"resource_id='{rid}'"],
             "Unknown resource_id (no stats.rpgs found)",
         )
@@ -149,175 +258,256 @@ def validate_resource_instance(
         add_error(
             errors,
             file_path,
-            repo_root,
             path_stack + [resource_label(resource_obj)],
             f"Missing or invalid stats object, got {type(stats).__name__}",
         )
         return
 
-    current_stack = path_stack + [resource_label(resource_obj)]
-    for stat_name, stat_value in stats.items():
-        if stat_name in META_STATS:
-            continue
-        stat_type = stats_schema.get(stat_name)
-        if stat_type is None:
-            add_error(
-                errors,
-                file_path,
-                repo_root,
-                current_stack + [f"stats.{stat_name}"],
-                "Unknown stat for this resource",
-            )
-            continue
-        if not isinstance(stat_value, dict) or "value" not in stat_value:
-            add_error(
-                errors,
-                file_path,
-                repo_root,
-                current_stack + [f"stats.{stat_name}"],
-                "Expected an object with a 'value' field",
-            )
-            continue
-        validate_value(
-            stat_value.get("value"),
-            stat_type,
-            schema,
-            errors,
-            file_path,
-            repo_root,
-            current_stack + [f"stats.{stat_name}.value"],
-        )
-
-
-def validate_value(
-    value: Any,
+    entry = VALIDATORS.get(rid)
+    validator = entry[1] if entry is not None and entry[0] is stats_schema else get_validator(rid, stats_schema)
+    path_stack.append(resource_label(resource_obj))
+    try:
+        validator(stats, schema, errors, file_path, path_stack)
+    finally:
+        path_stack.pop()
+
+
+SCALAR_CHECKS = {
+    "string": ("isinstance({var}, str)", "Expected string"),
+    "bool": ("isinstance({var}, bool)", "Expected bool"),
+    "integer": ("isinstance({var}, (int, float)) and not isinstance({var}, bool)", "Expected number"),
+}
+
+
+# Globals the generated validators read, bound as default arguments so they load as locals.
+BOUND_GLOBALS = (
+    "isinstance",
+    "type",
+    "enumerate",
+    "str",
+    "bool",
+    "int",
+    "float",
+    "dict",
+    "list",
+    "META_STATS",
+    "CHECKS",
+    "add_error",
+    "validate_resource_instance",
+)
+BOUND_GLOBAL_PATTERN = re.compile(r"\b(?:" + "|".join(BOUND_GLOBALS) + r")\b")
+CHECK_PARAMS = "value, schema, errors, file_path, stack"
+
+
+def function_source(name: str, params: str, body: List[str]) -> List[str]:
+    used = set(BOUND_GLOBAL_PATTERN.findall("\n".join(body)))
+    bound = "".join(f", {global_name}={global_name}" for global_name in BOUND_GLOBALS if global_name in used)
+    return [f"def {name}({params}{bound}):", *body]
+
+
+def element_check_source(
     stat_type: StatType,
-    schema: Dict[str, Dict[str, StatType]],
-    errors: List[str],
-    file_path: Path,
-    repo_root: Path,
-    path_stack: List[str],
-) -> None:
-    if value is None:
-        return
-
-    if stat_type.is_array:
-        if not isinstance(value, list):
-            add_error(
-                errors,
-                file_path,
-                repo_root,
-                path_stack,
-                f"Expected array, got {type(value).__name__}",
-            )
-            return
-        element_type = stat_type.element_type()
-        for idx, item in enumerate(value):
-            if item is None and element_type.kind == "resource":
-                continue
-            validate_value(
-                item,
-                element_type,
-                schema,
-                errors,
-                file_path,
-                repo_root,
-                path_stack + [f"[{idx}]"],
-            )
-        return
-
+    var: str,
+    segment: Optional[str],
+    indent: str,
+) -> List[str]:
+    """Source lines checking a non-None value held in ``var`` against a non-array type.
+
+    ``segment`` is an expression for the path segment of ``var`` below ``stack``, if any. It is
+    pushed onto ``stack`` only around the recursive resource check; errors copy the path anyway.
+    """
+    stack = "stack" if segment is None else f"stack + [{segment}]"
+    url_stack = 'stack + ["url"]' if segment is None else f'stack + [{segment}, "url"]'
+    report = f"add_error(errors, file_path, {stack}, "
+    got = f"{{type({var}).__name__}}"
     kind = stat_type.kind
-    if kind == "unknown":
-        return
-    if kind == "string":
-        if not isinstance(value, str):
-            add_error(
-                errors,
-                file_path,
-                repo_root,
-                path_stack,
-                f"Expected string, got {type(value).__name__}",
-            )
-        return
-    if kind == "bool":
-        if not isinstance(value, bool):
-            add_error(
-                errors,
-                file_path,
-                repo_root,
-                path_stack,
-                f"Expected bool, got {type(value).__name__}",
-            )
-        return
-    if kind == "integer":
-        if isinstance(value, bool) or not isinstance(value, (int, float)):
-            add_error(
-                errors,
-                file_path,
-                repo_root,
-                path_stack,
-                f"Expected number, got {type(value).__name__}",
-            )
-        return
+    if kind in SCALAR_CHECKS:
+        condition, message = SCALAR_CHECKS[kind]
+        return [
+            f"{indent}if not ({condition.format(var=var)}):",
+            f'{indent}    {report}f"{message}, got {got}")',
+        ]
     if kind == "photo":
-        if not isinstance(value, dict):
-            add_error(
-                errors,
-                file_path,
-                repo_root,
-                path_stack,
-                f"Expected photo object, got {type(value).__name__}",
-            )
-            return
-        if "url" in value and not isinstance(value["url"], str):
-            add_error(
-                errors,
-                file_path,
-                repo_root,
-                path_stack + ["url"],
-                f"Expected url string, got {type(value['url']).__name__}",
-            )
-        return
+        return [
+            f"{indent}if not isinstance({var}, dict):",
+            f'{indent}    {report}f"Expected photo object, got {got}")',
+            f'{indent}elif "url" in {var} and not isinstance({var}["url"], str):',
+            f"{indent}    add_error(errors, file_path, {url_stack}, "
+            f'f"Expected url string, got {{type({var}[\'url\']).__name__}}")',
+        ]
     if kind == "resource":
-        if not isinstance(value, dict):
-            add_error(
-                errors,
-                file_path,
-                repo_root,
-                path_stack,
-                f"Expected resource object, got {type(value).__name__}",
-            )
-            return
+        lines = [
+            f"{indent}if not isinstance({var}, dict):",
+            f'{indent}    {report}f"Expected resource object, got {got}")',
+            f"{indent}else:",
+        ]
         expected = stat_type.resource_type
-        actual = value.get("resource_id")
-        if expected and actual != expected:
+        if expected:
+            prefix = f"Expected resource_id '{expected}', got '"
+            lines += [
+                f'{indent}    actual = {var}.get("resource_id")',
+                f"{indent}    if actual != {expected!r}:",
+                f'{indent}        {report}{prefix!r} + f"{{actual}}\'")',
+            ]
+        call = f"validate_resource_instance({var}, schema, errors, file_path, stack)"
+        if segment is None:
+            lines.append(f"{indent}    {call}")
+        else:
+            lines += [
+                f"{indent}    stack.append({segment})",
+                f"{indent}    try:",
+                f"{indent}        {call}",
+                f"{indent}    finally:",
+                f"{indent}        stack.pop()",
+            ]
+        return lines
+    return [f"{indent}pass"]
+
+
+def stat_check_source(name: str, stat_type: StatType) -> List[str]:
+    if not stat_type.is_array:
+        return function_source(name, CHECK_PARAMS, element_check_source(stat_type, "value", None, "    "))
+    lines = [
+        "    if not isinstance(value, list):",
+        '        add_error(errors, file_path, stack, f"Expected array, got {type(value).__name__}")',
+        "        return",
+    ]
+    if stat_type.kind != "unknown":
+        lines += [
+            "    for idx, item in enumerate(value):",
+            "        if item is None:",
+            "            continue",
+        ]
+        lines += element_check_source(stat_type.element_type(), "item", 'f"[{idx}]"', "        ")
+    return function_source(name, CHECK_PARAMS, lines)
+
+
+def validator_code_object(rid: str, stats_schema: Dict[str, StatType]) -> CodeType:
+    """Generate a stats validator specialized to one resource's schema.
+
+    Each declared stat gets its own check function with the type tests inlined, so validating
+    an instance is a dict lookup and a call per stat rather than a walk over StatType fields.
+    """
+    lines: List[str] = []
+    checks: List[str] = []
+    for idx, (stat_name, stat_type) in enumerate(stats_schema.items()):
+        lines += stat_check_source(f"check_{idx}", stat_type)
+        checks.append(f"    {stat_name!r}: check_{idx},")
+    lines += ["CHECKS = {", *checks, "}"]
+    body = [
+        "    for stat_name, stat_value in stats.items():",
+        "        if stat_name in META_STATS:",
+        "            continue",
+        "        check = CHECKS.get(stat_name)",
+        "        if check is None:",
+        '            add_error(errors, file_path, stack + [f"stats.{stat_name}"], '
+        '"Unknown stat for this resource")',
+        "            continue",
+        '        if not isinstance(stat_value, dict) or "value" not in stat_value:',
+        '            add_error(errors, file_path, stack + [f"stats.{stat_name}"], '
+        '"Expected an object with a \'value\' field")',
+        "            continue",
+        '        value = stat_value["value"]',
+        "        if value is not None:",
+        '            stack.append(f"stats.{stat_name}.value")',
+        "            try:",
+        "                check(value, schema, errors, file_path, stack)",
+        "            finally:",
+        "                stack.pop()",
+    ]
+    lines += function_source("validate", "stats, schema, errors, file_path, stack", body)
+    return compile("\n".join(lines) + "\n", f"<validator:{rid}>", "exec")
+
+
+def build_validator(code: CodeType) -> Callable[..., None]:
+    namespace: Dict[str, Any] = {
+        "META_STATS": META_STATS,
+        "add_error": add_error,
+        "validate_resource_instance": validate_resource_instance,
+    }
+    exec(code, namespace)
+    return namespace["validate"]
+
+
+def compile_validator(rid: str, stats_schema: Dict[str, StatType]) -> Callable[..., None]:
+    return build_validator(validator_code_object(rid, stats_schema))
+
+
+def install_validators(schema: Dict[str, Dict[str, StatType]], validator_code: Dict[str, bytes]) -> None:
+    for rid, code in validator_code.items():
+        stats_schema = schema.get(rid)
+        if stats_schema is not None:
+            VALIDATORS[rid] = (stats_schema, build_validator(marshal.loads(code)))
+
+
+def get_validator(rid: str, stats_schema: Dict[str, StatType]) -> Callable[..., None]:
+    # Keyed on the schema object too, so validating against another schema recompiles.
+    entry = VALIDATORS.get(rid)
+    if entry is None or entry[0] is not stats_schema:
+        entry = (stats_schema, compile_validator(rid, stats_schema))
+        VALIDATORS[rid] = entry
+    return entry[1]
+
+
+def iter_instance_files(instances_root: Path) -> List[str]:
+    return list(scan_instance_dir(os.fspath(instances_root)))
+
+
+def init_worker(schema: Dict[str, Dict[str, StatType]], validator_code: Dict[str, bytes]) -> None:
+    global WORKER_SCHEMA
+    WORKER_SCHEMA = schema
+    install_validators(schema, validator_code)
+
+
+def peek_resource_id(payload: bytes) -> Optional[str]:
+    match = RESOURCE_ID_PEEK_PATTERN.match(payload)
+    if match is None:
+        return None
+    try:
+        return match.group(1).decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
+def validate_file(path: str, pending_read: "Optional[Future[bytes]]" = None) -> List[ErrorRecord]:
+    errors: List[ErrorRecord] = []
+    try:
+        payload = read_json_payload(path) if pending_read is None else pending_read.result()
+        rid = peek_resource_id(payload)
+        if rid is not None and rid not in WORKER_SCHEMA:
+            # Nothing else is checked for an unknown resource_id, so the rest isn't parsed; the
+            # message says so, since JSON syntax errors further in go unreported.
             add_error(
                 errors,
-                file_path,
-                repo_root,
-                path_stack,
-                f"Expected resource_id '{expected}', got '{actual}'",
+                path,
+                [f"resource_id='{rid}'"],
+                "Unknown resource_id (no stats.rpgs found; rest of the file not parsed)",
             )
-        validate_resource_instance(
-            value,
-            schema,
+            return errors
+        data = parse_json_bytes(payload)
+    except Exception as exc:  # noqa: BLE001 - report parse issues
+        add_error(
             errors,
-            file_path,
-            repo_root,
-            path_stack,
+            path,
+            [],
+            f"Failed to parse JSON: {exc}",
         )
+        return errors
+    validate_resource_instance(data, WORKER_SCHEMA, errors, path, [])
+    return errors
 
 
-def iter_instance_files(instances_root: Path) -> List[Path]:
-    files: List[Path] = []
-    for root, _dirs, filenames in os.walk(instances_root):
-        for filename in filenames:
-            if filename.startswith("."):
-                continue
-            if not filename.endswith((".json", ".rpg")):
-                continue
-            files.append(Path(root) / filename)
-    return files
+def collect_errors(
+    results: Iterable[List[ErrorRecord]],
+    errors: List[ErrorRecord],
+    fail_fast: bool,
+) -> bool:
+    """Extend ``errors`` with each file's errors; return True if ``fail_fast`` stopped early."""
+    for file_errors in results:
+        errors.extend(file_errors)
+        if fail_fast and file_errors:
+            return True
+    return False
 
 
 def infer_system_from_path(path: Path, repo_root: Path) -> Optional[str]:
@@ -335,6 +525,7 @@ def infer_system_from_path(path: Path, repo_root: Path) -> Optional[str]:
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Validate resource instance JSON against system stats.rpgs schema.",
+        epilog=BACKEND_HELP,
     )
     parser.add_argument(
         "--system",
@@ -351,7 +542,36 @@ def main() -> int:
         default=None,
         help="Validate a single resource instance file",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count, or 1 with --prefetch; 1 disables "
+        "the process pool)",
+    )
+    parser.add_argument(
+        "--prefetch",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Validate in-process, reading up to N files ahead on background threads "
+        "(useful on slow or network storage; default: 0, off)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse stats.rpgs files instead of using the schema cache under .cache/",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop after the first file with errors instead of validating every file",
+    )
     args = parser.parse_args()
+    if args.jobs is None:
+        args.jobs = 1 if args.prefetch > 0 else os.cpu_count() or 1
+    elif args.prefetch > 0 and args.jobs > 1:
+        parser.error("--prefetch reads ahead in-process, so it needs --jobs 1")
 
     repo_root = Path(__file__).resolve().parents[1]
     if args.file:
@@ -374,29 +594,43 @@ def main() -> int:
         print(f"Missing resource_instances folder: {instances_root}", file=sys.stderr)
         return 2
 
-    schema = load_schema(resources_root)
-    errors: List[str] = []
-    instance_files = [file_path] if args.file else iter_instance_files(instances_root)
-
-    for path in instance_files:
-        try:
-            data = read_json(path)
-        except Exception as exc:  # noqa: BLE001 - report parse issues
-            add_error(
-                errors,
-                path,
-                repo_root,
-                [],
-                f"Failed to parse JSON: {exc}",
-            )
-            continue
-        validate_resource_instance(data, schema, errors, path, repo_root, [])
+    cache_path = None if args.no_cache else repo_root / ".cache" / f"validate_schema_{system_name}.pkl"
+    schema, validator_code = load_cached_schema(resources_root, cache_path)
+    errors: List[ErrorRecord] = []
+    instance_files = [os.fspath(file_path)] if args.file else iter_instance_files(instances_root)
+
+    jobs = min(args.jobs, len(instance_files))
+    if jobs > 1:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=init_worker,
+            initargs=(schema, validator_code),
+        ) as executor:
+            chunksize = max(1, len(instance_files) // (jobs * 8))
+            results = executor.map(validate_file, instance_files, chunksize=chunksize)
+            stopped = collect_errors(results, errors, args.fail_fast)
+            if stopped:
+                executor.shutdown(wait=False, cancel_futures=True)
+    else:
+        init_worker(schema, validator_code)
+        if args.prefetch > 0:
+            reads = prefetch(read_json_payload, instance_files, args.prefetch)
+            results = (validate_file(path, read) for path, read in reads)
+        else:
+            results = (validate_file(path) for path in instance_files)
+        stopped = collect_errors(results, errors, args.fail_fast)
 
     if errors:
         print("Validation errors:", file=sys.stderr)
-        for err in errors:
-            print(f"- {err}", file=sys.stderr)
-        print(f"{len(errors)} error(s) found in {len(instance_files)} file(s).", file=sys.stderr)
+        for error in errors:
+            print(f"- {format_error(error, repo_root)}", file=sys.stderr)
+        if stopped:
+            print(
+                f"{len(errors)} error(s) found; stopped at the first failing file (--fail-fast).",
+                file=sys.stderr,
+            )
+        else:
+            print(f"{len(errors)} error(s) found in {len(instance_files)} file(s).", file=sys.stderr)
         return 1
 
     print(f"OK: {len(instance_files)} resource instance file(s) validated.")